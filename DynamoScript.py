@@ -1,3 +1,10 @@
+import numpy as np
+import pandas as pd
+
+#Revit to PowerCAD value translations
+CABLE_TYPE_MAP = {'4C+E': 'Multi', '4x1C+E': 'SDI', 'BUS DUCT': 'BD'}
+INSTALLATION_METHOD_MAP = {'LADDER, SPACED': 'L', 'PERFORATED TRAY, TOUCHING': 'PT', 'IN UNDERGROUND WIRING ENCLOSURE': 'C'}
+
 #The inputs to this node will be stored as a list in the IN variables.
 
 #Get inputs into Node
@@ -36,127 +43,62 @@ inProtectiveDeviceManufacturer = IN[15]
 #inProtectiveDeviceTripSetting = IN[]
 
 
-#Initiate List Variables
-cableReference = []
-swbFrom = []
-swbTo = []
-swbType = []
-swbLoad = []
-swbLoadScope = []
-swbPF = []
-cableLength = []
-cableSizeActiveconductors = []
-cableSizeNeutralconductors = []
-cableSizeEarthingconductor = []
-activeConductormaterial = []
-ofPhases = []
-cableType = []
-cableInsulation = []
-installationMethod = []
-cableAdditionalDerating = []
-switchgearTripUnitType = []
-switchgearManufacturer = []
-busType = []
-busChassisRating = []
-upstreamDiversity = []
-isolatorType = []
-isolatorRating = []
-protectiveDeviceRating = []
-protectiveDeviceManufacturer = []
-protectiveDeviceType = []
-protectiveDeviceModel = []
-protectiveDeviceOCRTripUnit = []
-protectiveDeviceTripSetting = []
-
-
-#Add header row
-cableReference.append('Cable Reference')
-swbFrom.append('SWB From')
-swbTo.append('SWB To')
-swbType.append('SWB Type')
-swbLoad.append('SWB Load')
-swbLoadScope.append('SWB Load Scope')
-swbPF.append('SWB PF')
-cableLength.append('Cable Length')
-cableSizeActiveconductors.append('Cable Size - Active conductors')
-cableSizeNeutralconductors.append('Cable Size - Neutral conductors')
-cableSizeEarthingconductor.append('Cable Size - Earthing conductor')
-activeConductormaterial.append('Active Conductor material')
-ofPhases.append('# of Phases')
-cableType.append('Cable Type')
-cableInsulation.append('Cable Insulation')
-installationMethod.append('Installation Method')
-cableAdditionalDerating.append('Cable Additional De-rating')
-switchgearTripUnitType.append('Switchgear Trip Unit Type')
-switchgearManufacturer.append('Switchgear Manufacturer')
-busType.append('Bus Type')
-busChassisRating.append('Bus/Chassis Rating (A)')
-upstreamDiversity.append('Upstream Diversity')
-isolatorType.append('Isolator Type')
-isolatorRating.append('Isolator Rating (A)')
-protectiveDeviceRating.append('Protective Device Rating (A)')
-protectiveDeviceManufacturer.append('Protective Device Manufacturer')
-protectiveDeviceType.append('Protective Device Type')
-protectiveDeviceModel.append('Protective Device Model')
-protectiveDeviceOCRTripUnit.append('Protective Device OCR/Trip Unit')
-protectiveDeviceTripSetting.append('Protective Device Trip Setting (A)')
-
-
-
-#Populate list with values 
-
-#Populate list with values 
-for i , indexValue in enumerate(indexList):
-	cableReference.append(inCableReference[i])
-	swbFrom.append(inSwbFrom[i])
-	swbTo.append(inSwbTo[i])
-	swbType.append('')
-	swbLoad.append(inSwbLoad[i])
-	swbLoadScope.append('Local')
-	swbPF.append(inSwbPF)
-	cableLength.append(inCableLength[i])
-	cableSizeActiveconductors.append(inCableSizeActiveconductors[i])
-	cableSizeNeutralconductors.append(inCableSizeNeutralconductors[i])
-	cableSizeEarthingconductor.append('')
-	activeConductormaterial.append(inActiveConductormaterial[i])
-	ofPhases.append('RWB')
-	if(inCableType[i] == "4C+E"): #Convert to PowerCAD values
-		cableType.append('Multi')
-	elif(inCableType[i] == "4x1C+E"):
-		cableType.append('SDI')
-	elif(inCableType[i] == "BUS DUCT"):
-		cableType.append('BD')
-	else:
-		cableType.append(inCableType[i])
-	cableInsulation.append(inCableInsulation[i])
-
-#	installationMethod.append(inInstallationMethod[i])
-	if(inInstallationMethod[i] == "LADDER, SPACED"): #Convert to PowerCAD values
-		installationMethod.append('L')
-	elif(inInstallationMethod[i] == "PERFORATED TRAY, TOUCHING"):
-		installationMethod.append('PT')
-	elif(inInstallationMethod[i] == "IN UNDERGROUND WIRING ENCLOSURE"):
-		installationMethod.append('C')
-	else:
-		installationMethod.append(inInstallationMethod[i])
-	cableAdditionalDerating.append('')
-	switchgearTripUnitType.append('Electronic')
-	switchgearManufacturer.append(inSwitchgearManufacturer)
-	busType.append('Bus Bar')
-	busChassisRating.append('')
-	upstreamDiversity.append('STD')
-	isolatorType.append('None')
-	isolatorRating.append('')
-	protectiveDeviceRating.append(inProtectiveDeviceRating[i])
-	protectiveDeviceManufacturer.append(inProtectiveDeviceManufacturer)
-	protectiveDeviceType.append('')
-	protectiveDeviceModel.append('')
-	protectiveDeviceOCRTripUnit.append('')
-	protectiveDeviceTripSetting.append('')
-	
-#combine lists into master list
-
-OUT = zip(cableReference, swbFrom, swbTo, swbType, swbLoad, swbLoadScope, swbPF, cableLength, cableSizeActiveconductors, cableSizeNeutralconductors, cableSizeEarthingconductor, activeConductormaterial, ofPhases, cableType, cableInsulation, installationMethod, cableAdditionalDerating, switchgearTripUnitType, switchgearManufacturer, busType, busChassisRating, upstreamDiversity, isolatorType, isolatorRating, protectiveDeviceRating, protectiveDeviceManufacturer, protectiveDeviceType, protectiveDeviceModel, protectiveDeviceOCRTripUnit, protectiveDeviceTripSetting)
-
-
-
+#Build the cable schedule one column at a time
+rowCount = len(indexList)
+
+#Some inputs may be wired in as a single value (possibly as a one-item list) or as one value per row
+def perRow(name, value):
+	if hasattr(value, '__iter__') and not isinstance(value, str):
+		value = list(value)
+		if len(value) == 1:
+			return value[0]
+		if len(value) != rowCount:
+			raise ValueError('%s has %d values, expected 1 or %d' % (name, len(value), rowCount))
+	return value
+
+cableTypes = pd.Series(inCableType[:rowCount], dtype=object)
+installationMethods = pd.Series(inInstallationMethod[:rowCount], dtype=object)
+
+df = pd.DataFrame({
+	'Cable Reference': inCableReference[:rowCount],
+	'SWB From': inSwbFrom[:rowCount],
+	'SWB To': inSwbTo[:rowCount],
+	'SWB Type': '',
+	'SWB Load': inSwbLoad[:rowCount],
+	'SWB Load Scope': 'Local',
+	'SWB PF': perRow('inSwbPF', inSwbPF),
+	'Cable Length': inCableLength[:rowCount],
+	'Cable Size - Active conductors': inCableSizeActiveconductors[:rowCount],
+	'Cable Size - Neutral conductors': inCableSizeNeutralconductors[:rowCount],
+	'Cable Size - Earthing conductor': '',
+	'Active Conductor material': inActiveConductormaterial[:rowCount],
+	'# of Phases': 'RWB',
+	#Convert to PowerCAD values
+	'Cable Type': cableTypes.replace(CABLE_TYPE_MAP),
+	'Cable Insulation': inCableInsulation[:rowCount],
+	#Convert to PowerCAD values
+	'Installation Method': installationMethods.replace(INSTALLATION_METHOD_MAP),
+	'Cable Additional De-rating': '',
+	'Switchgear Trip Unit Type': 'Electronic',
+	'Switchgear Manufacturer': perRow('inSwitchgearManufacturer', inSwitchgearManufacturer),
+	'Bus Type': 'Bus Bar',
+	'Bus/Chassis Rating (A)': '',
+	'Upstream Diversity': 'STD',
+	'Isolator Type': 'None',
+	'Isolator Rating (A)': '',
+	'Protective Device Rating (A)': inProtectiveDeviceRating[:rowCount],
+	'Protective Device Manufacturer': perRow('inProtectiveDeviceManufacturer', inProtectiveDeviceManufacturer),
+	'Protective Device Type': '',
+	'Protective Device Model': '',
+	'Protective Device OCR/Trip Unit': '',
+	'Protective Device Trip Setting (A)': '',
+}, dtype=object)
+
+#Store the fixed PowerCAD defaults as single-category columns
+for column in ['SWB Load Scope', '# of Phases', 'Switchgear Trip Unit Type', 'Bus Type', 'Upstream Diversity', 'Isolator Type']:
+	df[column] = df[column].astype('category')
+
+#combine header row and values into master list
+#Dynamo does not marshal ndarrays, so hand back nested lists
+
+OUT = np.vstack([df.columns.to_numpy(dtype=object), df.to_numpy(dtype=object)]).tolist()
@@ -1,5 +1,7 @@
 import csv
+import itertools
 import sqlite3
+import sys
 # import string
 import tkinter as tk
 from tkinter import filedialog
@@ -22,19 +24,22 @@ file_path = filedialog.askopenfilename()
 #     with open('my_file_utf8.csv', 'w') as outfile:
 #      outfile.write(infile.read())
 
+# Read and write in large blocks to cut down on per-read syscalls
+BUFFER_SIZE = 256 * 1024
+# Rows read, echoed and written per batch
+BATCH_SIZE = 10000
+
 # Open and Read the CSV file
-with open(file_path, 'r', encoding='ANSI', errors='ignore') as infile:
-    with open('my_file_utf8.csv', 'w', newline='') as outfile:
+with open(file_path, 'r', encoding='ANSI', errors='ignore', buffering=BUFFER_SIZE) as infile:
+    with open('my_file_utf8.csv', 'w', newline='', buffering=BUFFER_SIZE) as outfile:
         reader = csv.reader(infile)
         writer = csv.writer(outfile)
-        #Remove blank Rows
-        for row in reader:
-            print(row[0])
+        for rows in iter(lambda: list(itertools.islice(reader, BATCH_SIZE)), []):
+            # Echo the first column once per batch rather than one print per row
+            sys.stdout.write("\n".join(row[0] for row in rows) + "\n")
+
             #Remove blank Rows
-            if (not(row[7]=="" and row[8]=="")):
-                writer.writerow(row)
-                # writer.writerow("\n")
-            # firstRow = True
+            writer.writerows(row for row in rows if not (row[7]=="" and row[8]==""))
 
 # for row in csv_f:
 #     if (firstRow):
@@ -1,5 +1,6 @@
 import csv
 import sqlite3
+import sys
 import tkinter as tk
 from tkinter import filedialog
 
@@ -20,44 +21,45 @@ file_path='TrainDataUTF.CSV'
 #     with open('my_file_utf8.csv', 'w') as outfile:
 #      outfile.write(infile.read())
 
+# Read in large blocks to cut down on per-read syscalls
+BUFFER_SIZE = 256 * 1024
+
 conn = sqlite3.connect(":memory:")
+# Nothing to recover for an in-memory database, so skip journalling
+conn.execute('PRAGMA journal_mode=OFF')
+conn.execute('PRAGMA synchronous=OFF')
 
-# Open a file: file
-file = open('TrainDataUTF.CSV',mode='r')
- 
-# read all lines at once
-all_of_it = file.read()
- 
-# close the file
-file.close()
-
-# Open and Read the CSV file
-with open(file_path, 'r', encoding='UTF-8') as infile:
+# Open and Read the CSV file, letting utf-8-sig drop the byte order mark at the start
+with open(file_path, 'r', encoding='utf-8-sig', buffering=BUFFER_SIZE) as infile:
     reader = csv.reader(infile)
-    
-    firstRow = True
-    for row in reader:
-        if (firstRow):
-            #Remove blank Rows
-            fields=""
-            for element in row:
-                newelement=element.replace('\ufeff', '')
-                fields+="'"+newelement+"', "
-            conn.execute("CREATE TABLE cableSchedule ("+fields[:-2]+")")
-            firstRow = False
-        elif (not(row[7]=="" and row[8]=="")):
-            values=""
-            for element in row:
-                newelement=element.replace('\ufeff', '')
-                values+="'"+newelement+"', "
-
-            conn.execute("INSERT INTO cableSchedule VALUES ("+values[:-2]+")")
-
-for row in conn.execute("SELECT `Cable Code`, `Cable Configuration` FROM cableSchedule WHERE NOT(`Cable Reference` = '') ORDER BY `Cable Reference` ASC"):
-    number1=int(row[0])
-    number2=int(row[1])
-    newNumber = number1*number2
-    print(str(number1) + " | "+ str(number2) + " | " + str(newNumber))
+
+    fields = next(reader)
+    conn.execute("CREATE TABLE cableSchedule (" + ", ".join("`" + field.replace("`", "``") + "`" for field in fields) + ")")
+
+    #Remove blank Rows
+    rows = [row for row in reader if not (row[7]=="" and row[8]=="")]
+
+# Insert every row through one prepared statement in a single transaction
+with conn:
+    conn.executemany("INSERT INTO cableSchedule VALUES (" + ", ".join("?" * len(fields)) + ")", rows)
+
+def report_line(code, configuration, number1, number2, newNumber, exact):
+    # Values SQLite could not cast exactly (signs, padding, blanks, bad data) go through int() as before
+    if not exact:
+        number1 = int(code)
+        number2 = int(configuration)
+        newNumber = number1 * number2
+    return str(number1) + " | " + str(number2) + " | " + str(newNumber) + "\n"
+
+# Let SQLite do the arithmetic and write the report in one go
+results = conn.execute(
+    "SELECT code, configuration, number1, number2, number1 * number2,"
+    " CAST(number1 AS TEXT) = code AND CAST(number2 AS TEXT) = configuration AND typeof(number1 * number2) = 'integer'"
+    " FROM (SELECT `Cable Reference` AS reference, `Cable Code` AS code, `Cable Configuration` AS configuration,"
+    " CAST(`Cable Code` AS INTEGER) AS number1, CAST(`Cable Configuration` AS INTEGER) AS number2"
+    " FROM cableSchedule WHERE NOT(`Cable Reference` = ''))"
+    " ORDER BY reference ASC")
+sys.stdout.write("".join(report_line(*row) for row in results))
 
 # xlsxwriter
 
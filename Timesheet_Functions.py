@@ -1,41 +1,51 @@
-import pandas as pd
-import tkinter as tk
-from tkinter import filedialog
+import polars as pl
+import xlsxwriter
+
+
+def pick_file():
+    # Tkinter is only loaded when the user actually needs to browse for a file
+    import tkinter as tk
+    from tkinter import filedialog
+
+    # Create a Tkinter window to browse for the CSV file
+    root = tk.Tk()
+    root.withdraw()  # Hide the root window
+    # Ask the user to select the CSV file
+    file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
+    root.destroy()
+
+    return file_path
 
-# Create a Tkinter window to browse for the CSV file
-root = tk.Tk()
-root.withdraw()  # Hide the root window
-# Ask the user to select the CSV file
-file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
 
 def clean_data(file_path):
-    # Load the CSV file as a dataframe
-    df = pd.read_csv(file_path)
+    # Load the CSV file as a dataframe, skipping the financial columns and unnecessary columns
+    df = pl.read_csv(file_path, columns=['Contact', 'Project Name', 'Tasks', 'Date', 'Duration (hours)', 'Description'],
+                     null_values='')
 
-    # Remove the financial columns and unnecessary columns
-    df = df.drop(['ID', 'Invoice', 'Hourly Rate', 'Duration (mins)', 'Billable Amount', 'Billable Currency'], axis=1)
+    # Parse the "Date" column once so the weekday and the sort both use real dates
+    df = df.with_columns(pl.col('Date').str.to_date('%Y-%m-%d'))
 
     # Add a "Day of Week" column based on the "Date" column
-    df['Day of Week'] = pd.to_datetime(df['Date']).dt.day_name()
+    df = df.with_columns(pl.col('Date').dt.strftime('%A').alias('Day of Week'))
 
     # Reorder the columns
-    df = df[['Contact','Project Name','Tasks','Date', 'Day of Week', 'Duration (hours)', 'Description']]
+    df = df.select(['Contact','Project Name','Tasks','Date', 'Day of Week', 'Duration (hours)', 'Description'])
 
     # Sort the dataframe in ascending order based on the "Date" column
-    df = df.sort_values(by='Date')
+    df = df.sort('Date', maintain_order=True)
 
     return df
 
 
 def export_data(df, csv_file_name, xlsx_file_name):
     # Create or override the CSV file with the current data
-    df.to_csv(csv_file_name, index=False)
+    df.write_csv(csv_file_name)
     
-    # Export data to XLSX format
-    df.to_excel(xlsx_file_name, index=False)
+    # Export data to XLSX format as a plain range, writing row by row so xlsxwriter can stream it
+    with xlsxwriter.Workbook(xlsx_file_name, {'constant_memory': True, 'default_date_format': 'yyyy-mm-dd'}) as workbook:
+        worksheet = workbook.add_worksheet('Sheet1')
+        worksheet.write_row(0, 0, df.columns)
+        for row_number, row in enumerate(df.iter_rows(), start=1):
+            worksheet.write_row(row_number, 0, row)
     
     print(f"Data exported to {csv_file_name} and {xlsx_file_name} successfully.")
-
-
-
-
@@ -1,23 +1,26 @@
-import tkinter as tk
-from tkinter import filedialog
+import os
+import sys
 import pandas as pd
 import Timesheet_Functions as TF
 from fpdf import FPDF
 
-# Create a Tkinter window to browse for the CSV file
-root = tk.Tk()
-root.withdraw()  # Hide the root window
+if __name__ == '__main__':
+    # Take the CSV file from the command line, fall back to Timesheet.csv, or browse for it
+    if len(sys.argv) > 1:
+        file_path = sys.argv[1]
+    elif os.path.exists('Timesheet.csv'):
+        file_path = 'Timesheet.csv'
+    else:
+        file_path = TF.pick_file()
+        if not file_path:
+            sys.exit("No timesheet CSV selected.")
 
-# Ask the user to select the CSV file
-#file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
-file_path = 'Timesheet.csv'
+    # cleaned_df = pd.DataFrame()
+    cleaned_df = TF.clean_data(file_path)
 
-# cleaned_df = pd.DataFrame()
-cleaned_df = TF.clean_data(file_path)
+    # Print the resulting dataframe
+    print(cleaned_df)
 
-# Print the resulting dataframe
-print(cleaned_df)
 
-
-TF.export_data(cleaned_df,'CSV_Time.csv', 'XLSX_Time.xlsx')
+    TF.export_data(cleaned_df,'CSV_Time.csv', 'XLSX_Time.xlsx')
 